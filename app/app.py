@@ -1,9 +1,11 @@
 import streamlit as st
+import streamlit.components.v1 as components
 import folium
-from streamlit_folium import st_folium
 import geopandas as gpd
 from pathlib import Path
 import pandas as pd
+import pyarrow.parquet as pq
+import shapely
 
 # Page config
 st.set_page_config(
@@ -20,39 +22,176 @@ PROJECT_ROOT = Path(__file__).parent.parent
 DATA_DIR = PROJECT_ROOT / 'data'
 PROCESSED_DATA_DIR = DATA_DIR / 'processed'
 
+# GeoParquet file (in data/processed/enumeration_area_data) per enumeration area layer,
+# see scripts/convert_to_parquet.py. The road_points layer is not used by the app.
+ENUM_LAYER_FILES = {
+    'grid_cells': 'grid_cells.parquet',
+    'centroids': 'centroids_merged.parquet',  # already joined with the grid cells' nearest road link
+    'village_points': 'village_points.parquet',
+}
+
+# Fields read from each enumeration area layer: only what the map uses (geometry is
+# always read)
+ENUM_LAYER_COLUMNS = {
+    'grid_cells': ['grid_id', 'station_name', 'cluster_type'],
+    'centroids': ['grid_id', 'station_name', 'cluster_type', 'centroid_maps_link', 'nearest_road_maps_link'],
+    'village_points': ['grid_id', 'station_name', 'nearest_address_full', 'village', 'district', 'region'],
+}
+
+# Columns of the cluster table that are not shown in the app (not read from disk)
+CLUSTER_TABLE_DROP_COLUMNS = ['processing_success', 'found_at_radius', 'geometry']
+
+# Rows of the cluster table sent to the browser by default
+CLUSTER_TABLE_ROWS = 100
+
+# Decimal places kept for map coordinates (~1 m)
+COORD_DECIMALS = 5
+
+# CRS all layers are stored in (WGS84, the CRS folium renders in)
+MAP_EPSG = 4326
+
+# Low-cardinality string columns stored as categoricals
+CATEGORICAL_COLUMNS = ['station_name', 'cluster_type']
+
+# Files read by load_data; their modification times key the cached map
+DATA_FILES = [
+    PROCESSED_DATA_DIR / 'station_loc.parquet',
+    PROCESSED_DATA_DIR / 'sampling_clusters_full_data.parquet',
+    *(PROCESSED_DATA_DIR / 'enumeration_area_data' / filename for filename in ENUM_LAYER_FILES.values()),
+]
+
+# Map legend parts (one station item per station on the map)
+LEGEND_HEADER = """
+    <div style="position: fixed; 
+                bottom: 50px; right: 50px; width: 200px; height: auto;
+                background-color: white;
+                border: 2px solid grey;
+                z-index: 1000;
+                padding: 10px;
+                font-size: 14px;">
+    <p><strong>Radio Stations</strong></p>
+    """
+LEGEND_STATION_ITEM = """
+        <p><i class="fa fa-circle" style="color:{color}"></i> {name}</p>
+        """
+LEGEND_GRID_CELLS = """
+    <p><strong>Grid Cells</strong></p>
+    <p>● Solid - Main<br>● Dashed - Replacement</p>
+    """
+LEGEND_VILLAGES = "<p>● Purple - Nearest Village</p>"
+LEGEND_FOOTER = """
+    </div>
+    """
+
+# Above this many features (grid cells + centroids + villages) the map draws its vector
+# layers on a canvas
+CANVAS_FEATURE_THRESHOLD = 500
+
+# Grid cell outline dash pattern per cluster type (solid for main clusters)
+GRID_DASH_ARRAYS = {'main': None, 'replacement': '5,5'}
+
+# Station marker: a white badge with the radio icon in the station color
+STATION_ICON_SIZE = (30, 30)
+STATION_ICON_HTML = """
+    <div style="box-sizing: border-box; width: 30px; height: 30px; line-height: 26px; text-align: center;
+                background-color: white; border: 2px solid {color}; border-radius: 50%;
+                font-size: 14px; color: {color};">
+    <i class="fa fa-radio"></i>
+    </div>
+    """
+
+# Rendered maps kept in memory (one per station selection, roughly 0.1-0.4 MB each)
+MAP_CACHE_ENTRIES = 32
+
+
+def get_data_version():
+    """Return the modification times of the data files (cache-buster for cached results)"""
+    return tuple(path.stat().st_mtime for path in DATA_FILES)
+
+
+def round_coordinates(gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
+    """Round all geometry coordinates to COORD_DECIMALS places"""
+    rounded = shapely.transform(gdf.geometry.values, lambda coords: coords.round(COORD_DECIMALS))
+    return gdf.set_geometry(rounded, crs=gdf.crs)
+
+
 # Load data
+@st.cache_resource(show_spinner=False, max_entries=1)
+def read_data(data_version: tuple):
+    """Read and prepare all required geodata files (cached; do not modify the results in place)"""
+    # Load station-related data (GeoParquet, see scripts/convert_to_parquet.py)
+    station_loc_gdf = gpd.read_parquet(PROCESSED_DATA_DIR / 'station_loc.parquet')
+    # Parquet copy of the csv to be shared with datateam (contains all the relevant info but is
+    # not a gdf); the columns the app does not show are skipped at read time
+    clusters_path = PROCESSED_DATA_DIR / 'sampling_clusters_full_data.parquet'
+    sampling_clusters_full_data = pd.read_parquet(
+        clusters_path,
+        columns=[c for c in pq.read_schema(clusters_path).names if c not in CLUSTER_TABLE_DROP_COLUMNS]
+    )
+    # Load enumeration area layers (GeoParquet, one file per layer of enumeration_area_data.gpkg);
+    # only the fields in ENUM_LAYER_COLUMNS are read from disk
+    enum_layers = {
+        layer: gpd.read_parquet(
+            PROCESSED_DATA_DIR / 'enumeration_area_data' / filename,
+            columns=ENUM_LAYER_COLUMNS[layer] + ['geometry']
+        )
+        for layer, filename in ENUM_LAYER_FILES.items()
+    }
+    
+    # Check all layers are stored in MAP_EPSG
+    for name, gdf in [('station_loc', station_loc_gdf), *enum_layers.items()]:
+        if gdf.crs is None or gdf.crs.to_epsg() != MAP_EPSG:
+            raise ValueError(f"{name} must be stored in EPSG:{MAP_EPSG}, found {gdf.crs}")
+    
+    # Drop points that cannot be drawn (village_points has empty points for cells where no
+    # address was found)
+    for layer in ['centroids', 'village_points']:
+        points = enum_layers[layer].geometry
+        enum_layers[layer] = enum_layers[layer][~(points.isna() | points.is_empty) & points.is_valid]
+    
+    # Round coordinates of the layers drawn on the map
+    for layer in ['grid_cells', 'centroids', 'village_points']:
+        enum_layers[layer] = round_coordinates(enum_layers[layer])
+    
+    # Store the CATEGORICAL_COLUMNS of every frame as categoricals
+    for df in [station_loc_gdf, sampling_clusters_full_data, *enum_layers.values()]:
+        for col in CATEGORICAL_COLUMNS:
+            if col in df.columns:
+                df[col] = df[col].astype('category')
+    
+    # Station table as shown in the app (without the point geometries)
+    station_table = pd.DataFrame(station_loc_gdf.drop(columns=['geometry']))
+    
+    return station_loc_gdf, station_table, sampling_clusters_full_data, enum_layers
+
+
 def load_data():
-    """Load all required geodata files"""
+    """Load all required geodata files (parsed once, then served from the cache)"""
     try:
-        # Load station-related data
-        station_loc_gdf = gpd.read_file(PROCESSED_DATA_DIR / 'station_loc.gpkg')
-        station_buffers_gdf = gpd.read_file(PROCESSED_DATA_DIR / 'station_buffers.gpkg')
-        sampling_clusters_full_data=pd.read_csv(PROCESSED_DATA_DIR/'sampling_clusters_full_data.csv') # this is the csv to be shared with datateam (contains all the relevant info but is not a g)
-        # Load enumeration area layers
-        enum_layers = {
-            'grid_cells': gpd.read_file(PROCESSED_DATA_DIR / 'enumeration_area_data.gpkg', layer='grid_cells'),
-            'centroids': gpd.read_file(PROCESSED_DATA_DIR / 'enumeration_area_data.gpkg', layer='centroids'),
-            'road_points': gpd.read_file(PROCESSED_DATA_DIR / 'enumeration_area_data.gpkg', layer='road_points'),
-            'village_points': gpd.read_file(PROCESSED_DATA_DIR / 'enumeration_area_data.gpkg', layer='village_points')
-        }
-        
-        # Filter buffers for 25km only
-        station_buffers_gdf = station_buffers_gdf[station_buffers_gdf['buffer_km'] == 25]
-        
-        # Join grid_cells data to centroids
-        enum_layers['centroids'] = enum_layers['centroids'].merge(
-            enum_layers['grid_cells'][['station_name', 'grid_id', 'nearest_road_maps_link']], 
-            on=['station_name', 'grid_id'], 
-            how='left'
-        )
-        
-        return station_loc_gdf,  station_buffers_gdf, sampling_clusters_full_data, enum_layers
+        return read_data(get_data_version())
     
     except Exception as e:
         st.error(f"Error loading data: {str(e)}")
         return None, None, None, None
 
 
+def split_by_station(gdf: gpd.GeoDataFrame, station_names: list) -> dict:
+    """Split a layer into {station_name: rows}; stations without rows get an empty frame"""
+    groups = dict(list(gdf.groupby('station_name', sort=False, observed=True)))
+    return {station: groups.get(station, gdf.iloc[:0]) for station in station_names}
+
+
+def grid_cell_style(feature: dict) -> dict:
+    """Outline-only grid cell style; color and dash pattern come from the feature properties"""
+    return {
+        'fillColor': None,
+        'color': feature['properties']['stroke_color'],
+        'weight': 2,
+        'fillOpacity': 0,
+        'dashArray': feature['properties']['dash_array']
+    }
+
+
 def create_station_map(station_names: list, 
                       station_loc_gdf: gpd.GeoDataFrame,
                       enum_layers: dict,
@@ -60,11 +199,27 @@ def create_station_map(station_names: list,
     # Filter data for specified stations
     station_locs = station_loc_gdf[station_loc_gdf['station_name'].isin(station_names)]
     
-    # Create base map
+    # Nothing to draw: return a bare map
+    if station_locs.empty:
+        return folium.Map(zoom_start=zoom_start)
+    known_stations = set(station_locs['station_name'])
+    station_names = [station for station in station_names if station in known_stations]
+    
+    # Split the layers by station
+    station_colors = dict(zip(station_locs['station_name'], station_locs['color']))
+    grids_by_station = split_by_station(enum_layers['grid_cells'], station_names)
+    centroids_by_station = split_by_station(enum_layers['centroids'], station_names)
+    villages_by_station = split_by_station(enum_layers['village_points'], station_names)
+    
+    n_features = sum(len(rows) for layer in (grids_by_station, centroids_by_station, villages_by_station)
+                     for rows in layer.values())
+    
+    # Create base map (large maps draw vector layers on a single canvas)
     m = folium.Map(
-        location=[station_locs.geometry.y.mean(), station_locs.geometry.x.mean()],
+        location=[station_locs['latitude'].mean(), station_locs['longitude'].mean()],
         zoom_start=zoom_start,
-        tiles=None  # Start with no base map
+        tiles=None,  # Start with no base map
+        prefer_canvas=n_features > CANVAS_FEATURE_THRESHOLD
     )
     
     # Add different tile layers
@@ -81,33 +236,16 @@ def create_station_map(station_names: list,
     ).add_to(m)
 
     # Create legend
-    legend_html = """
-    <div style="position: fixed; 
-                bottom: 50px; right: 50px; width: 200px; height: auto;
-                background-color: white;
-                border: 2px solid grey;
-                z-index: 1000;
-                padding: 10px;
-                font-size: 14px;">
-    <p><strong>Radio Stations</strong></p>
-    """
-    
-    for idx, row in station_locs.iterrows():
-        legend_html += f"""
-        <p><i class="fa fa-circle" style="color:{row['color']}"></i> {row['station_name']}</p>
-        """
-    
-    legend_html += """
-    <p><strong>Grid Cells</strong></p>
-    <p>● Solid - Main<br>● Dashed - Replacement</p>
-    """
-    
-    if not enum_layers['village_points'].empty and not enum_layers['village_points'].geometry.isna().all():
-        legend_html += "<p>● Purple - Nearest Village</p>"
-    
-    legend_html += """
-    </div>
-    """
+    legend_parts = [LEGEND_HEADER]
+    legend_parts.extend(
+        LEGEND_STATION_ITEM.format(color=color, name=name)
+        for color, name in zip(station_locs['color'].to_numpy(), station_locs['station_name'].to_numpy())
+    )
+    legend_parts.append(LEGEND_GRID_CELLS)
+    if any(not villages.empty for villages in villages_by_station.values()):
+        legend_parts.append(LEGEND_VILLAGES)
+    legend_parts.append(LEGEND_FOOTER)
+    legend_html = "".join(legend_parts)
     
     m.get_root().html.add_child(folium.Element(legend_html))
     
@@ -117,97 +255,90 @@ def create_station_map(station_names: list,
         station_groups[station] = folium.FeatureGroup(name=f'{station}')
         
         # Get station color
-        station_color = station_locs[station_locs['station_name'] == station]['color'].iloc[0]
+        station_color = station_colors[station]
         
         # Add grid cells (use different styles for main and replacement)
-        station_grids = enum_layers['grid_cells'][enum_layers['grid_cells']['station_name'] == station]
-        grid_layer = folium.GeoJson(
-            station_grids,
-            name=f"{station}_grids",
-            style_function=lambda feature: {
-                'fillColor': None,
-                'color': station_color,
-                'weight': 2,
-                'fillOpacity': 0,
-                'dashArray': '5,5' if feature['properties']['cluster_type'] == 'replacement' else None
-            }
-        )
-        grid_layer.add_to(station_groups[station])
+        station_grids = grids_by_station[station]
+        if not station_grids.empty:
+            station_grids = station_grids.assign(
+                stroke_color=station_color,
+                dash_array=station_grids['cluster_type'].map(GRID_DASH_ARRAYS)
+            )
+            grid_layer = folium.GeoJson(
+                station_grids[['stroke_color', 'dash_array', 'geometry']],
+                name=f"{station}_grids",
+                style_function=grid_cell_style
+            )
+            grid_layer.add_to(station_groups[station])
         
-        # Add centroid markers
-        station_centroids = enum_layers['centroids'][enum_layers['centroids']['station_name'] == station]
-        for idx, row in station_centroids.iterrows():
-            if row.geometry is not None:
-                folium.CircleMarker(
-                    location=[row.geometry.y, row.geometry.x],
+        # Add centroid markers (a single GeoJson layer per station; tooltip and popup
+        # fields are filled in client-side from the feature properties)
+        station_centroids = centroids_by_station[station]
+        if not station_centroids.empty:
+            station_centroids = station_centroids.assign(
+                nearest_road_link="<a href='" + station_centroids['nearest_road_maps_link'] + "' target='_blank'>Link</a>",
+                centroid_link="<a href='" + station_centroids['centroid_maps_link'] + "' target='_blank'>Link</a>"
+            )
+            centroid_fields = ['grid_id', 'station_name', 'cluster_type', 'nearest_road_link', 'centroid_link']
+            centroid_aliases = ['Grid ID:', 'Station:', 'Cluster Type:', 'Nearest Road:', 'Centroid:']
+            folium.GeoJson(
+                station_centroids[centroid_fields + ['geometry']],
+                name=f"{station}_centroids",
+                marker=folium.CircleMarker(
                     radius=4,
                     color=station_color,
                     fill=True,
-                    weight=2,
-                    tooltip=folium.Tooltip(f"""
-                        Grid ID: {row.grid_id}
-                        Station: {row.station_name}
-                        Cluster Type: {row['cluster_type']}
-                        Nearest Road: <a href='{row.nearest_road_maps_link}' target='_blank'>Link</a>
-                        Centroid: <a href='{row.centroid_maps_link}' target='_blank'>Link</a>
-                    """),
-                    popup=folium.Popup(
-                        f"""<div style='width: 300px'>
-                        <b style="color:{station_color}">Grid ID:</b> {row.grid_id}<br>
-                        <b style="color:{station_color}">Station:</b> {row.station_name}<br>
-                        <b style="color:{station_color}">Cluster Type:</b> {row['cluster_type']}<br>
-                        <a href='{row.nearest_road_maps_link}' target='_blank'>Nearest Road</a><br>
-                        <a href='{row.centroid_maps_link}' target='_blank'>Centroid</a>
-                        </div>""",
-                        max_width=300
-                    )
-                ).add_to(station_groups[station])
-        
-        # Add village point markers
-        station_villages = enum_layers['village_points'][enum_layers['village_points']['station_name'] == station]
-        for idx, row in station_villages.iterrows():
-            if row.geometry is not None and not pd.isna(row.geometry):
-                try:
-                    folium.CircleMarker(
-                        location=[row.geometry.y, row.geometry.x],
-                        radius=4,
-                        color='purple',
-                        fill=True,
-                        weight=2,
-                        tooltip=folium.Tooltip(f"""
-                            Nearest address found in grid cell:
-                            {row.nearest_address_full}
-                            Village: {row.village}
-                            District: {row.district}
-                            Region: {row.region}
-                        """),
-                        popup=folium.Popup(
-                            f"""<div style='width: 300px'>
-                            <b>Grid ID:</b> {row.grid_id}<br>
-                            <b>Nearest Address:</b> {row.nearest_address_full}<br>
-                            <b>Village:</b> {row.village}<br>
-                            <b>District:</b> {row.district}<br>
-                            <b>Region:</b> {row.region}
-                            </div>""",
-                            max_width=300
-                        )
-                    ).add_to(station_groups[station])
-                except:
-                    continue
+                    weight=2
+                ),
+                tooltip=folium.GeoJsonTooltip(fields=centroid_fields, aliases=centroid_aliases),
+                popup=folium.GeoJsonPopup(
+                    fields=centroid_fields,
+                    aliases=[f"<span style='color:{station_color}'>{alias}</span>" for alias in centroid_aliases],
+                    localize=False,
+                    max_width=300
+                )
+            ).add_to(station_groups[station])
         
-        # Add station marker
-        station_loc = station_locs[station_locs['station_name'] == station].iloc[0]
+        # Add village point markers (cells where no address was found are dropped at load)
+        station_villages = villages_by_station[station]
+        if not station_villages.empty:
+            village_fields = ['grid_id', 'nearest_address_full', 'village', 'district', 'region']
+            folium.GeoJson(
+                station_villages[village_fields + ['geometry']],
+                name=f"{station}_villages",
+                marker=folium.CircleMarker(
+                    radius=4,
+                    color='purple',
+                    fill=True,
+                    weight=2
+                ),
+                tooltip=folium.GeoJsonTooltip(
+                    fields=['nearest_address_full', 'village', 'district', 'region'],
+                    aliases=['Nearest address found in grid cell:', 'Village:', 'District:', 'Region:']
+                ),
+                popup=folium.GeoJsonPopup(
+                    fields=village_fields,
+                    aliases=['Grid ID:', 'Nearest Address:', 'Village:', 'District:', 'Region:'],
+                    localize=False,
+                    max_width=300
+                )
+            ).add_to(station_groups[station])
+    
+    # Add station markers
+    for name, color, lat, lon in zip(station_locs['station_name'].to_numpy(),
+                                     station_locs['color'].to_numpy(),
+                                     station_locs['latitude'].to_numpy(),
+                                     station_locs['longitude'].to_numpy()):
         folium.Marker(
-            location=[station_loc.geometry.y, station_loc.geometry.x],
-            popup=f"<span style='color:{station_color};'>{station_loc['station_name']}</span>",
-            tooltip=folium.Tooltip(f"Click to see {station_loc['station_name']} location"),
-            icon=folium.Icon(
-                color='white',
-                icon_color=station_color,
-                icon='radio',
-                prefix='fa'
+            location=[lat, lon],
+            popup=f"<span style='color:{color};'>{name}</span>",
+            tooltip=folium.Tooltip(f"Click to see {name} location"),
+            icon=folium.DivIcon(
+                html=STATION_ICON_HTML.format(color=color),
+                icon_size=STATION_ICON_SIZE,
+                icon_anchor=(STATION_ICON_SIZE[0] // 2, STATION_ICON_SIZE[1] // 2)
             )
-        ).add_to(station_groups[station])
+        ).add_to(station_groups[name])
     
     # Add all groups to the map
     for group in station_groups.values():
@@ -216,11 +347,17 @@ def create_station_map(station_names: list,
     # Add layer control
     folium.LayerControl(collapsed=False).add_to(m)
     
-    # Save the map to an HTML file
-    
-
     return m
 
+
+@st.cache_resource(show_spinner=False, max_entries=MAP_CACHE_ENTRIES)
+def render_station_map(station_names: tuple, data_version: tuple) -> str:
+    """Build the map for the given (sorted) stations and return it rendered as HTML"""
+    station_loc_gdf, _, _, enum_layers = load_data()
+    m = create_station_map(list(station_names), station_loc_gdf, enum_layers)
+    return m.get_root().render()
+
+
 def get_data_documentation():
     """Returns the data documentation as a markdown string"""
     return """
@@ -234,7 +371,6 @@ def get_data_documentation():
     | buffer_km | Km that grid is buffered out from radio station location/mast (25 km) |
     | est_population_2020 | Estimated population size in grid cell (est. 2020) |
     | cluster_type | Main or replacement cluster (35 main and 35 replacement per radio station) |
-    | geometry | Geometry/polygon of 1km by 1km grid cell (for geospatial operations) |
 
     ## Grid Cell Location
     | Column | Description |
@@ -272,12 +408,34 @@ def get_data_documentation():
     """
 
 
+@st.fragment
+def render_map_section(available_stations: list):
+    """Station selection and map (a fragment: only this section reruns on a new selection)"""
+    selected_stations = st.multiselect(
+        "Select Radio Stations to Display",
+        options=available_stations,
+        default=['Aisa FM', 'Dwanwana FM', 'Dokolo FM']
+    )
+    
+    if selected_stations:
+        # Create and display map (pre-rendered HTML, cached per selection)
+        map_html = render_station_map(tuple(sorted(selected_stations)), get_data_version())
+        components.html(map_html, width=1200, height=800)
+        # Download the rendered map
+        st.download_button(
+            "Download map",
+            data=map_html,
+            file_name="radio_station_map.html",
+            mime="text/html"
+        )
+
+
 def main():
     st.title("📻 Radio Station Coverage sampling LM (test)")
     
     try:
         # Load data
-        station_loc_gdf,  station_buffers_gdf, sampling_clusters_full_data, enum_layers = load_data()
+        station_loc_gdf, station_table, sampling_clusters_full_data, enum_layers = load_data()
         
         if station_loc_gdf is not None:
             # Add description
@@ -296,36 +454,26 @@ def main():
             
             # Display station data
             with st.expander("View Station Data"):
-                display_df = station_loc_gdf.drop(columns=['geometry'])
-                st.dataframe(display_df)
-            
-            # Station selection
-            available_stations = station_loc_gdf['station_name'].unique().tolist()
-            selected_stations = st.multiselect(
-                "Select Radio Stations to Display",
-                options=available_stations,
-                default=['Aisa FM', 'Dwanwana FM', 'Dokolo FM']
-            )
+                st.dataframe(station_table)
             
-            if selected_stations:
-                # Create and display map
-                m = create_station_map(
-                    selected_stations,
-                    station_loc_gdf,
-                    enum_layers
-                )
-                st_folium(m, width=1200, height=800)
+            # Station selection and map
+            available_stations = station_loc_gdf['station_name'].tolist()
+            render_map_section(available_stations)
             
             # Display cluster data
             with st.expander("View data on sampled clusters"):
                 #create 2 tabs 
                 data_tab, docs_tab = st.tabs(["Data", "Documentation"])
                 with data_tab:
-                    display_df_2 = sampling_clusters_full_data.copy()
-                    # Remove unnecessary columns if needed
-                    cols_to_drop = ['processing_success', 'found_at_radius']  # Add any other columns you want to drop
-                    display_df_2 = display_df_2.drop(columns=cols_to_drop)
-                    st.dataframe(display_df_2)
+                    # Show the first n rows; head(n) limits what is sent to the browser
+                    n_rows = st.number_input(
+                        "Rows to show",
+                        min_value=0,
+                        max_value=len(sampling_clusters_full_data),
+                        value=min(CLUSTER_TABLE_ROWS, len(sampling_clusters_full_data)),
+                        step=CLUSTER_TABLE_ROWS
+                    )
+                    st.dataframe(sampling_clusters_full_data.head(n_rows))
                 with docs_tab:
                      # Display the documentation markdown
                     st.markdown(get_data_documentation())
@@ -334,9 +482,10 @@ def main():
     except Exception as e:
         st.error(f"Error loading data: {str(e)}")
         st.write("Please ensure all required data files are present in the processed data directory:")
-        st.write("- station_loc.gpkg")
-        st.write("- station_buffers.gpkg")
-        st.write("- enumeration_area_data.gpkg with all required layers")
+        st.write("- station_loc.parquet")
+        st.write("- sampling_clusters_full_data.parquet")
+        st.write("- enumeration_area_data/ with grid_cells, centroids_merged and village_points parquet files")
+        st.write("(run scripts/convert_to_parquet.py to create the parquet files from the notebook outputs)")
 
 if __name__ == "__main__":
     main()
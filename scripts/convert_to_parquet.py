@@ -0,0 +1,66 @@
+"""Convert the processed data files read by the app to (Geo)Parquet.
+
+Parquet is columnar and decoded straight into Arrow/NumPy memory, so the app
+loads it considerably faster than the SQLite-backed GeoPackages and the CSV
+produced by the notebooks, and can skip the columns it does not use. Re-run this
+script whenever the notebooks regenerate the files in data/processed:
+
+    python scripts/convert_to_parquet.py
+"""
+from pathlib import Path
+
+import geopandas as gpd
+import pandas as pd
+
+# Setup paths
+PROJECT_ROOT = Path(__file__).parent.parent
+PROCESSED_DATA_DIR = PROJECT_ROOT / 'data' / 'processed'
+
+# CRS of all app data (the CRS folium renders in)
+TARGET_EPSG = 4326
+
+# (GeoPackage source, layer, GeoParquet target), paths relative to data/processed;
+# a layer of None reads the file's only layer
+LAYER_CONVERSIONS = [
+    ('station_loc.gpkg', None, 'station_loc.parquet'),
+    ('enumeration_area_data.gpkg', 'grid_cells', 'enumeration_area_data/grid_cells.parquet'),
+    ('enumeration_area_data.gpkg', 'centroids', 'enumeration_area_data/centroids_merged.parquet'),
+    ('enumeration_area_data.gpkg', 'village_points', 'enumeration_area_data/village_points.parquet'),
+]
+
+# Grid cell fields joined onto each centroid (on station and grid id) before writing
+CENTROID_GRID_FIELDS = ['nearest_road_maps_link']
+
+# CSV source -> Parquet target (both in data/processed)
+CSV_CONVERSIONS = {
+    'sampling_clusters_full_data.csv': 'sampling_clusters_full_data.parquet',
+}
+
+
+def read_layer(source, layer):
+    """Read a GeoPackage layer reprojected to TARGET_EPSG"""
+    return gpd.read_file(PROCESSED_DATA_DIR / source, layer=layer, engine='pyogrio').to_crs(epsg=TARGET_EPSG)
+
+
+def main():
+    for source, layer, target in LAYER_CONVERSIONS:
+        gdf = read_layer(source, layer)
+        if layer == 'centroids':
+            grid_cells = read_layer(source, 'grid_cells')
+            gdf = gdf.merge(
+                grid_cells[['station_name', 'grid_id'] + CENTROID_GRID_FIELDS],
+                on=['station_name', 'grid_id'],
+                how='left'
+            )
+        (PROCESSED_DATA_DIR / target).parent.mkdir(parents=True, exist_ok=True)
+        gdf.to_parquet(PROCESSED_DATA_DIR / target, compression='snappy')
+        print(f"{source}{f' ({layer})' if layer else ''} -> {target} ({len(gdf)} rows)")
+    
+    for source, target in CSV_CONVERSIONS.items():
+        df = pd.read_csv(PROCESSED_DATA_DIR / source, index_col=0)
+        df.to_parquet(PROCESSED_DATA_DIR / target, compression='snappy')
+        print(f"{source} -> {target} ({len(df)} rows)")
+
+
+if __name__ == "__main__":
+    main()